@@ -30,18 +30,70 @@ To efficiently use this server, follow these best practices:
 Following these guidelines will result in faster, more reliable responses and better user experience.
 """
 import os
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union, Any
+import asyncio
+import functools
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union, Any
+from zoneinfo import ZoneInfo
+import orjson
+from sortedcontainers import SortedList
 from pydantic import BaseModel, Field
 from fastmcp import FastMCP, Context, Image
+from mcp.types import TextContent
 import robin_stocks.robinhood as rh
 
+# Bound once so calls skip the repeated rh.<module> attribute lookups
+_stocks = rh.stocks
+_orders = rh.orders
+_account = rh.account
+
+# Use uvloop's faster event loop when it is installed (it is not available on Windows).
+# Set at import time so it also applies when the server is started by the fastmcp CLI.
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# ----- JSON serialization -----
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively (datetime is handled by orjson)."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to JSON text using orjson."""
+    return orjson.dumps(
+        obj,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+def _raw(obj: Any) -> TextContent:
+    """
+    Wrap a JSON-safe tool result as pre-serialized text content.
+
+    FastMCP passes content blocks through untouched, so the result is encoded once
+    with orjson and skips FastMCP's own conversion and output-schema validation.
+    """
+    return TextContent(type="text", text=_dumps(obj))
+
 # Initialize the MCP server
 mcp = FastMCP(
     "robinhood", 
-    dependencies=["robin_stocks", "pydantic"],
-    description="A server that provides stock trading functionality through Robinhood"
+    dependencies=["fastmcp>=2.2.7", "robin_stocks", "pydantic", "orjson>=3.10", "sortedcontainers", "tzdata",
+                  "uvloop; sys_platform != 'win32'", "httptools"],
+    description="A server that provides stock trading functionality through Robinhood",
+    tool_serializer=_dumps
 )
 
 # ----- Models for request/response data -----
@@ -73,10 +125,140 @@ class StockInfo(BaseModel):
     """Model for stock information"""
     ticker: str = Field(..., description="Stock ticker symbol")
 
+# ----- Helpers -----
+
+# US market time zone, used to report order timestamps (Robinhood returns UTC)
+ET = ZoneInfo("America/New_York")
+
+@functools.lru_cache(maxsize=4096)
+def _instrument_symbol(instrument_url: str) -> str:
+    """
+    Fetch the ticker symbol for an instrument URL.
+
+    Instrument URLs map to tickers one-to-one, so results are memoized for the life of
+    the process. Failed lookups raise and are therefore never cached.
+    """
+    return _stocks.get_instrument_by_url(instrument_url)["symbol"]
+
+# Helper function to get ticker from instrument URL
+def get_ticker_from_instrument(instrument_url: str) -> str:
+    """Get ticker symbol from instrument URL."""
+    try:
+        if not instrument_url:
+            return "UNKNOWN"
+        return _instrument_symbol(instrument_url)
+    except:
+        return "UNKNOWN"
+
+async def resolve_tickers(instrument_urls: Iterable[str]) -> Dict[str, str]:
+    """
+    Map instrument URLs to ticker symbols.
+
+    Each distinct URL is looked up once, and the lookups run concurrently in worker threads.
+    """
+    urls = list({url for url in instrument_urls if url})
+    tickers = await asyncio.gather(
+        *(asyncio.to_thread(get_ticker_from_instrument, url) for url in urls)
+    )
+    return dict(zip(urls, tickers))
+
+# Last result of rh.orders.get_all_stock_orders(), shared by the order history tools
+_orders_cache: Dict[str, Any] = {"ts": 0.0, "data": None}
+
+# Orders for past dates rarely change, so an older fetch can answer queries about them
+HISTORICAL_ORDERS_MAX_AGE = 24 * 60 * 60
+
+def _parse_day(date: str) -> datetime:
+    """Parse a YYYY-MM-DD date into the start of that day in UTC."""
+    return datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+def _orders_max_age(day: datetime) -> float:
+    """
+    How old (in seconds) a cached order history may be to answer a query for a day.
+
+    Today's orders are still changing, so a fetch is trusted for a minute. For past days
+    a fetch is reused for up to a day, but only if it was made after that day ended.
+    """
+    day_end = day + timedelta(days=1)
+    since_day_end = time.time() - day_end.timestamp()
+    if since_day_end <= 0:
+        return 60
+    return min(since_day_end, HISTORICAL_ORDERS_MAX_AGE)
+
+async def _all_orders(max_age: float = 60) -> List[Dict[str, Any]]:
+    """Get all stock orders, reusing the last fetch if it is less than max_age seconds old."""
+    now = time.time()
+    if _orders_cache["data"] is not None and now - _orders_cache["ts"] < max_age:
+        return _orders_cache["data"]
+    orders = await asyncio.to_thread(_orders.get_all_stock_orders)
+    _orders_cache.update(ts=now, data=orders)
+    return orders
+
+def _iter_orders_for_date(orders: Iterable[Dict[str, Any]], day: datetime) -> Iterator[Dict[str, Any]]:
+    """Yield the orders created on a UTC day, in a single pass."""
+    # created_at is an ISO 8601 UTC timestamp, so the day's orders share its date prefix
+    prefix = day.strftime("%Y-%m-%d")
+    for order in orders:
+        if order.get('created_at', '').startswith(prefix):
+            yield order
+
+def _ttl_cache(ttl: float, maxsize: int = 1024) -> Callable[[Callable], Callable]:
+    """
+    Cache a blocking fetcher's results per argument tuple for ttl seconds.
+
+    Once maxsize entries are held the oldest one is evicted. The wrapper gets a
+    cache_clear() method like functools.lru_cache.
+    """
+    def decorator(fn: Callable) -> Callable:
+        cache: Dict[Any, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+            value = fn(*args)
+            with lock:
+                if args not in cache and len(cache) >= maxsize:
+                    del cache[next(iter(cache))]
+                cache[args] = (now, value)
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+# Quotes move constantly but LLM workflows often ask for the same one in bursts
+QUOTE_CACHE_TTL = 5
+FUNDAMENTALS_CACHE_TTL = 60
+
+@_ttl_cache(QUOTE_CACHE_TTL)
+def _cached_quotes(ticker: str) -> Any:
+    return _stocks.get_quotes(ticker)
+
+@_ttl_cache(QUOTE_CACHE_TTL)
+def _cached_latest_price(ticker: str) -> Any:
+    return _stocks.get_latest_price(ticker)
+
+@_ttl_cache(FUNDAMENTALS_CACHE_TTL)
+def _cached_fundamentals(ticker: str) -> Any:
+    return _stocks.get_fundamentals(ticker)
+
+def _clear_account_caches() -> None:
+    """Drop cached account data after logging in or out, or placing or cancelling an order."""
+    _orders_cache.update(ts=0.0, data=None)
+
 # ----- Authentication -----
 
 @mcp.tool()
-async def login(credentials: LoginCredentials) -> Dict[str, Any]:
+async def login(credentials: LoginCredentials) -> TextContent:
     """
     Login to Robinhood with the provided credentials.
     
@@ -84,57 +266,60 @@ async def login(credentials: LoginCredentials) -> Dict[str, Any]:
     It stores the authentication token for subsequent requests.
     """
     try:
-        login_response = rh.login(
+        login_response = await asyncio.to_thread(
+            rh.login,
             username=credentials.username,
             password=credentials.password,
             mfa_code=credentials.mfa_code
         )
+        _clear_account_caches()
         
         # Return a sanitized version of the response
-        return {
+        return _raw({
             "success": True,
             "message": "Successfully logged in to Robinhood",
             "expires_in": login_response.get("expires_in", 86400),
             "scope": login_response.get("scope", "internal")
-        }
+        })
     except Exception as e:
-        return {
+        return _raw({
             "success": False,
             "message": f"Login failed: {str(e)}"
-        }
+        })
 
 @mcp.tool()
-async def logout() -> Dict[str, str]:
+async def logout() -> TextContent:
     """
     Logout from Robinhood and invalidate the current session.
     """
     try:
-        rh.logout()
-        return {"status": "success", "message": "Successfully logged out from Robinhood"}
+        await asyncio.to_thread(rh.logout)
+        _clear_account_caches()
+        return _raw({"status": "success", "message": "Successfully logged out from Robinhood"})
     except Exception as e:
-        return {"status": "error", "message": f"Logout failed: {str(e)}"}
+        return _raw({"status": "error", "message": f"Logout failed: {str(e)}"})
 
 # ----- Stock Information -----
 
 @mcp.tool()
-async def get_stock_quote(stock_info: StockInfo) -> Dict[str, Any]:
+async def get_stock_quote(stock_info: StockInfo) -> TextContent:
     """
     Get the latest quote information for a stock.
     
     Returns latest price, bid/ask, volume, and other quote information.
     """
+    ticker = stock_info.ticker.upper()
     try:
-        ticker = stock_info.ticker.upper()
-        quote_info = rh.stocks.get_quotes(ticker)
+        quote_info = await asyncio.to_thread(_cached_quotes, ticker)
         
         if not quote_info or isinstance(quote_info, list) and not quote_info:
-            return {"status": "error", "message": f"No quote data found for {ticker}"}
+            return _raw({"status": "error", "message": f"No quote data found for {ticker}"})
             
         if isinstance(quote_info, list):
             quote_info = quote_info[0]
             
         # Clean up the response to include just the most relevant information
-        return {
+        return _raw({
             "status": "success",
             "ticker": ticker,
             "ask_price": float(quote_info.get("ask_price", 0)),
@@ -143,50 +328,52 @@ async def get_stock_quote(stock_info: StockInfo) -> Dict[str, Any]:
             "previous_close": float(quote_info.get("previous_close", 0)),
             "updated_at": quote_info.get("updated_at", ""),
             "volume": int(float(quote_info.get("volume", 0)))
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to get quote for {stock_info.ticker}: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to get quote for {ticker}: {str(e)}"})
 
 @mcp.tool()
-async def get_latest_price(stock_info: StockInfo) -> Dict[str, Any]:
+async def get_latest_price(stock_info: StockInfo) -> TextContent:
     """
     Get the latest price for a stock.
     
     Returns a simple response with just the latest price.
     """
+    ticker = stock_info.ticker.upper()
     try:
-        ticker = stock_info.ticker.upper()
-        price = rh.stocks.get_latest_price(ticker)
+        price = await asyncio.to_thread(_cached_latest_price, ticker)
         
         if not price or not price[0]:
-            return {"status": "error", "message": f"No price data found for {ticker}"}
+            return _raw({"status": "error", "message": f"No price data found for {ticker}"})
             
-        return {
+        return _raw({
             "status": "success",
             "ticker": ticker,
             "price": float(price[0])
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to get price for {ticker}: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to get price for {ticker}: {str(e)}"})
 
 # ----- Trading Operations -----
 
 @mcp.tool()
-async def buy_stock_market_order(order: StockOrder) -> Dict[str, Any]:
+async def buy_stock_market_order(order: StockOrder) -> TextContent:
     """
     Place a market order to buy a stock.
     
     Places an order to buy the specified quantity of a stock at the current market price.
     """
     try:
-        result = rh.orders.order_buy_market(
+        result = await asyncio.to_thread(
+            _orders.order_buy_market,
             symbol=order.ticker,
             quantity=order.quantity,
             timeInForce=order.time_in_force,
             extendedHours=order.extended_hours
         )
+        _clear_account_caches()
         
-        return {
+        return _raw({
             "status": "success",
             "order_id": result.get("id", ""),
             "state": result.get("state", ""),
@@ -195,26 +382,28 @@ async def buy_stock_market_order(order: StockOrder) -> Dict[str, Any]:
             "type": "market",
             "side": "buy",
             "created_at": result.get("created_at", "")
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to place buy order: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to place buy order: {str(e)}"})
 
 @mcp.tool()
-async def sell_stock_market_order(order: StockOrder) -> Dict[str, Any]:
+async def sell_stock_market_order(order: StockOrder) -> TextContent:
     """
     Place a market order to sell a stock.
     
     Places an order to sell the specified quantity of a stock at the current market price.
     """
     try:
-        result = rh.orders.order_sell_market(
+        result = await asyncio.to_thread(
+            _orders.order_sell_market,
             symbol=order.ticker,
             quantity=order.quantity,
             timeInForce=order.time_in_force,
             extendedHours=order.extended_hours
         )
+        _clear_account_caches()
         
-        return {
+        return _raw({
             "status": "success",
             "order_id": result.get("id", ""),
             "state": result.get("state", ""),
@@ -223,27 +412,29 @@ async def sell_stock_market_order(order: StockOrder) -> Dict[str, Any]:
             "type": "market",
             "side": "sell",
             "created_at": result.get("created_at", "")
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to place sell order: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to place sell order: {str(e)}"})
 
 @mcp.tool()
-async def buy_stock_limit_order(order: LimitOrder) -> Dict[str, Any]:
+async def buy_stock_limit_order(order: LimitOrder) -> TextContent:
     """
     Place a limit order to buy a stock.
     
     Places an order to buy the specified quantity of a stock at or below the specified limit price.
     """
     try:
-        result = rh.orders.order_buy_limit(
+        result = await asyncio.to_thread(
+            _orders.order_buy_limit,
             symbol=order.ticker,
             quantity=order.quantity,
             limitPrice=order.price,
             timeInForce=order.time_in_force,
             extendedHours=order.extended_hours
         )
+        _clear_account_caches()
         
-        return {
+        return _raw({
             "status": "success",
             "order_id": result.get("id", ""),
             "state": result.get("state", ""),
@@ -253,27 +444,29 @@ async def buy_stock_limit_order(order: LimitOrder) -> Dict[str, Any]:
             "type": "limit",
             "side": "buy",
             "created_at": result.get("created_at", "")
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to place buy limit order: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to place buy limit order: {str(e)}"})
 
 @mcp.tool()
-async def sell_stock_limit_order(order: LimitOrder) -> Dict[str, Any]:
+async def sell_stock_limit_order(order: LimitOrder) -> TextContent:
     """
     Place a limit order to sell a stock.
     
     Places an order to sell the specified quantity of a stock at or above the specified limit price.
     """
     try:
-        result = rh.orders.order_sell_limit(
+        result = await asyncio.to_thread(
+            _orders.order_sell_limit,
             symbol=order.ticker,
             quantity=order.quantity,
             limitPrice=order.price,
             timeInForce=order.time_in_force,
             extendedHours=order.extended_hours
         )
+        _clear_account_caches()
         
-        return {
+        return _raw({
             "status": "success",
             "order_id": result.get("id", ""),
             "state": result.get("state", ""),
@@ -283,60 +476,61 @@ async def sell_stock_limit_order(order: LimitOrder) -> Dict[str, Any]:
             "type": "limit",
             "side": "sell",
             "created_at": result.get("created_at", "")
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to place sell limit order: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to place sell limit order: {str(e)}"})
 
 @mcp.tool()
-async def cancel_order(order_id: str) -> Dict[str, Any]:
+async def cancel_order(order_id: str) -> TextContent:
     """
     Cancel an open order by order ID.
     
     Cancels an open order that hasn't been executed yet.
     """
     try:
-        result = rh.orders.cancel_stock_order(order_id)
-        return {
+        result = await asyncio.to_thread(_orders.cancel_stock_order, order_id)
+        _clear_account_caches()
+        return _raw({
             "status": "success" if result else "error",
             "order_id": order_id,
             "message": "Order cancelled successfully" if result else "Failed to cancel order"
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to cancel order: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to cancel order: {str(e)}"})
 
 # ----- Portfolio Information -----
 
 @mcp.tool()
-async def get_portfolio() -> Dict[str, Any]:
+async def get_portfolio() -> TextContent:
     """
     Get portfolio information including equity value, cash balance, and other account details.
     """
     try:
-        portfolio = rh.account.build_portfolio()
-        return {
+        portfolio = await asyncio.to_thread(_account.build_portfolio)
+        return _raw({
             "status": "success",
             "equity": float(portfolio.get("equity", 0)),
             "extended_hours_equity": float(portfolio.get("extended_hours_equity", 0)),
             "cash": float(portfolio.get("cash", 0)),
             "dividend_total": float(portfolio.get("dividend_total", 0))
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to get portfolio: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to get portfolio: {str(e)}"})
 
 @mcp.tool()
-async def get_positions() -> Dict[str, Any]:
+async def get_positions() -> TextContent:
     """
     Get current positions in the portfolio.
     
     Returns all stocks currently held in the account, with quantity and cost basis.
     """
     try:
-        positions = rh.account.get_open_stock_positions()
+        positions = await asyncio.to_thread(_account.get_open_stock_positions)
+        tickers = await resolve_tickers(position.get("instrument", "") for position in positions)
         formatted_positions = []
         
         for position in positions:
-            instrument_data = rh.stocks.get_instrument_by_url(position.get("instrument", ""))
-            ticker = instrument_data.get("symbol", "UNKNOWN")
+            ticker = tickers.get(position.get("instrument", ""), "UNKNOWN")
             quantity = float(position.get("quantity", 0))
             average_buy_price = float(position.get("average_buy_price", 0))
             
@@ -347,28 +541,27 @@ async def get_positions() -> Dict[str, Any]:
                 "cost_basis": quantity * average_buy_price
             })
         
-        return {
+        return _raw({
             "status": "success",
             "positions": formatted_positions
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to get positions: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to get positions: {str(e)}"})
 
 @mcp.tool()
-async def get_open_orders() -> Dict[str, Any]:
+async def get_open_orders() -> TextContent:
     """
     Get all open orders.
     
     Returns all orders that are currently open (e.g., unfilled limit orders).
     """
     try:
-        orders = rh.orders.get_all_open_stock_orders()
+        orders = await asyncio.to_thread(_orders.get_all_open_stock_orders)
+        tickers = await resolve_tickers(order.get("instrument", "") for order in orders)
         formatted_orders = []
         
         for order in orders:
-            # Parse the instrument URL to get the ticker
-            instrument_data = rh.stocks.get_instrument_by_url(order.get("instrument", ""))
-            ticker = instrument_data.get("symbol", "UNKNOWN")
+            ticker = tickers.get(order.get("instrument", ""), "UNKNOWN")
             
             formatted_orders.append({
                 "order_id": order.get("id", ""),
@@ -381,68 +574,75 @@ async def get_open_orders() -> Dict[str, Any]:
                 "state": order.get("state", "")
             })
         
-        return {
+        return _raw({
             "status": "success",
             "orders": formatted_orders
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to get open orders: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to get open orders: {str(e)}"})
 
 @mcp.tool()
-async def get_orders_by_date(date: str) -> Dict[str, Any]:
+async def get_orders_by_date(date: str, summary: bool = True) -> TextContent:
     """
     Get all orders placed on a specific date.
     
     Returns all orders (open, filled, canceled, etc.) created on the specified date.
     The date must be in YYYY-MM-DD format (e.g., '2025-05-02').
+    
+    By default each order is summarized; pass summary=False to also include its
+    individual executions and its creation time in Eastern Time.
     """
     try:
-        # Get all orders from the Robinhood API
-        all_orders = rh.orders.get_all_stock_orders()
+        day = _parse_day(date)
+        
+        # Get all orders from the Robinhood API (or the recent cached fetch)
+        all_orders = await _all_orders(_orders_max_age(day))
         
         # Filter orders by the specified date
+        date_orders = list(_iter_orders_for_date(all_orders, day))
+        
+        # Look up the tickers for all distinct instruments at once
+        tickers = await resolve_tickers(o.get("instrument", "") for o in date_orders)
+        
         filtered_orders = []
-        for order in all_orders:
-            if order.get('created_at', '').startswith(date):
-                # Parse the instrument URL to get the ticker
-                instrument_data = rh.stocks.get_instrument_by_url(order.get("instrument", ""))
-                ticker = instrument_data.get("symbol", "UNKNOWN")
-                
-                # Format the order data
-                formatted_order = {
-                    "order_id": order.get("id", ""),
-                    "ticker": ticker,
-                    "side": order.get("side", ""),
-                    "quantity": float(order.get("quantity", 0)),
-                    "type": order.get("type", ""),
-                    "price": float(order.get("price", 0)) if order.get("price") else None,
-                    "created_at": order.get("created_at", ""),
-                    "state": order.get("state", ""),
-                    "executions": order.get("executions", []),
-                    "filled_quantity": float(order.get("cumulative_quantity", 0)),
-                    "average_price": float(order.get("average_price", 0)) if order.get("average_price") else None
-                }
+        for order in date_orders:
+            ticker = tickers.get(order.get("instrument", ""), "UNKNOWN")
+            
+            # Format the order data
+            formatted_order = {
+                "order_id": order.get("id", ""),
+                "ticker": ticker,
+                "side": order.get("side", ""),
+                "quantity": float(order.get("quantity", 0)),
+                "type": order.get("type", ""),
+                "price": float(order.get("price", 0)) if order.get("price") else None,
+                "created_at": order.get("created_at", ""),
+                "state": order.get("state", ""),
+                "filled_quantity": float(order.get("cumulative_quantity", 0)),
+                "average_price": float(order.get("average_price", 0)) if order.get("average_price") else None
+            }
+            
+            if not summary:
+                formatted_order["executions"] = order.get("executions", [])
                 
                 # Convert created_at time from UTC to Eastern Time
-                if "created_at" in order and order["created_at"]:
-                    # Parse the ISO timestamp
-                    utc_time = order["created_at"].replace('Z', '+00:00')
-                    # Calculate ET (UTC-4 during daylight saving time)
-                    formatted_order["created_at_et"] = f"{utc_time[0:19]}Z (ET: {utc_time[11:16]} ET)"
-                
-                filtered_orders.append(formatted_order)
+                if order.get("created_at"):
+                    created_at = datetime.fromisoformat(order["created_at"].replace("Z", "+00:00"))
+                    formatted_order["created_at_et"] = created_at.astimezone(ET).isoformat(timespec="seconds")
+            
+            filtered_orders.append(formatted_order)
         
         # Sort orders by created_at timestamp (newest first)
         filtered_orders.sort(key=lambda x: x.get("created_at", ""), reverse=True)
         
-        return {
+        return _raw({
             "status": "success",
             "date": date,
             "orders_count": len(filtered_orders),
             "orders": filtered_orders
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to get orders for date {date}: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to get orders for date {date}: {str(e)}"})
 
 # ----- Market Data Resources -----
 
@@ -453,7 +653,7 @@ async def get_stock_info(ticker: str) -> Dict[str, Any]:
     """
     try:
         ticker = ticker.upper()
-        stock_info = rh.stocks.get_fundamentals(ticker)[0]
+        stock_info = (await asyncio.to_thread(_cached_fundamentals, ticker))[0]
         
         return {
             "ticker": ticker,
@@ -475,8 +675,10 @@ async def get_portfolio_summary() -> Dict[str, Any]:
     Get a summary of the portfolio's performance and composition.
     """
     try:
-        portfolio = rh.account.build_portfolio()
-        positions = rh.account.get_open_stock_positions()
+        portfolio, positions = await asyncio.gather(
+            asyncio.to_thread(_account.build_portfolio),
+            asyncio.to_thread(_account.get_open_stock_positions)
+        )
         
         # Count number of different stocks
         positions_count = len(positions)
@@ -503,7 +705,7 @@ async def get_account_history(timespan: str) -> Dict[str, Any]:
         if timespan not in valid_timespans:
             return {"error": f"Invalid timespan: {timespan}. Must be one of {', '.join(valid_timespans)}"}
             
-        history = rh.account.get_historical_portfolio(interval=timespan)
+        history = await asyncio.to_thread(_account.get_historical_portfolio, interval=timespan)
         
         # Extract the key information from the history
         equity_data = []
@@ -525,72 +727,159 @@ async def get_account_history(timespan: str) -> Dict[str, Any]:
         return {"error": f"Failed to get account history: {str(e)}"}
 
 
-# Helper function to get ticker from instrument URL
-def get_ticker_from_instrument(instrument_url: str) -> str:
-    """Get ticker symbol from instrument URL."""
-    try:
-        if not instrument_url:
-            return "UNKNOWN"
-        instrument_data = rh.stocks.get_instrument_by_url(instrument_url)
-        return instrument_data.get("symbol", "UNKNOWN")
-    except:
-        return "UNKNOWN"
+class TradeRecord(NamedTuple):
+    """A filled order reduced to the fields used for profit matching"""
+    id: Optional[str]
+    price: float
+    quantity: float
+    fees: float
+    created_at: Optional[str]
+
+def _closest_sell(available: SortedList, price: float) -> int:
+    """
+    Get the index of the available sell whose price is closest to the given price.
+
+    Entries are (price, index) pairs with indexes assigned in descending price order.
+    Ties go to the higher price, then to the lower index.
+    """
+    pos = available.bisect_left((price, -1))
+    above = available[pos] if pos < len(available) else None
+    below = None
+    if pos > 0:
+        # Lowest index among the sells at the nearest lower price
+        below = available[available.bisect_left((available[pos - 1][0], -1))]
+
+    if below is None or (above is not None and abs(above[0] - price) <= abs(below[0] - price)):
+        return above[1]
+    return below[1]
+
+def _match_trades(
+    buy_px: List[float],
+    buy_qty: List[float],
+    buy_ts: List[str],
+    buy_fees: List[float],
+    sell_px: List[float],
+    sell_qty: List[float],
+    sell_ts: List[str],
+    sell_fees: List[float]
+) -> List[Tuple[int, int, float, float, float]]:
+    """
+    Pair each buy with later sells at the closest price.
+
+    Takes one ticker's trades as parallel columns, with buys sorted by time (earliest
+    first) and sells sorted by price (highest first). Returns a
+    (buy index, sell index, quantity, net profit, fees) tuple per match, in match order.
+    """
+    sell_rem = list(sell_qty)  # For tracking matched portions
+
+    # Sells that can still be matched, keyed by (price, index) so the closest price
+    # to a buy can be found by bisection
+    available = SortedList((sell_px[j], j) for j in range(len(sell_px)) if sell_rem[j] > 0)
+
+    # Sells in time order, so those created before the current buy can be retired
+    sells_by_time = sorted(range(len(sell_ts)), key=sell_ts.__getitem__)
+    next_by_time = 0
+
+    matches = []
+    for i in range(len(buy_px)):
+        # Sells are only ever removed, so once none are left no later buy can match
+        if not available:
+            break
+
+        # Only consider sells that happened after this buy. Buys are in time
+        # order, so a sell retired here is never eligible for a later buy.
+        while (next_by_time < len(sells_by_time)
+               and sell_ts[sells_by_time[next_by_time]] <= buy_ts[i]):
+            j = sells_by_time[next_by_time]
+            available.discard((sell_px[j], j))
+            next_by_time += 1
+
+        # This buy's fields are read on every match, so bind them once
+        buy_price, buy_total, buy_fee = buy_px[i], buy_qty[i], buy_fees[i]
+        remaining_qty = buy_total
+
+        # Continue matching until this buy is fully matched or no more sells
+        while remaining_qty > 0 and available:
+            # Get the sell with closest price
+            j = _closest_sell(available, buy_price)
+            sell_price, sell_left = sell_px[j], sell_rem[j]
+
+            # Determine quantity to match
+            match_qty = min(remaining_qty, sell_left)
+
+            # Calculate profit for this match
+            trade_profit = (sell_price - buy_price) * match_qty
 
+            # Calculate proportional fees
+            buy_fee_portion = buy_fee * (match_qty / buy_total)
+            sell_fee_portion = sell_fees[j] * (match_qty / sell_qty[j])
+            total_fees = buy_fee_portion + sell_fee_portion
+
+            # Final profit after fees
+            matches.append((i, j, match_qty, trade_profit - total_fees, total_fees))
+
+            # Update remaining quantities
+            sell_left -= match_qty
+            sell_rem[j] = sell_left
+            if sell_left <= 0:
+                available.remove((sell_price, j))
+
+            remaining_qty -= match_qty
+
+    return matches
 
 @mcp.tool()
-async def analyze_trading_profit(date: str) -> Dict[str, Any]:
+async def analyze_trading_profit(date: str, summary: bool = True) -> TextContent:
     """
     Calculate profit/loss from day trading on a specific date.
     
     Analyzes all trades made on the specified date using closest-price matching algorithm,
     which pairs buy/sell orders based on price similarity for more accurate profit calculation.
+    
+    By default only per-ticker totals are returned; pass summary=False to also include
+    the individual matched buy/sell pairs for each ticker.
     """
     try:
+        day = _parse_day(date)
+
         # Get orders for the specified date
-        all_orders = rh.orders.get_all_stock_orders()
-        filtered_orders = [o for o in all_orders if o.get('created_at', '').startswith(date)]
+        all_orders = await _all_orders(_orders_max_age(day))
 
-        # Filter by filled status (completed trades)
-        filled_orders = [o for o in filtered_orders if o.get('state') == 'filled']
+        # Filter by filled status (completed trades) in the same pass
+        filled_orders = [o for o in _iter_orders_for_date(all_orders, day) if o.get('state') == 'filled']
+
+        # Look up the tickers for all distinct instruments at once
+        tickers = await resolve_tickers(o.get("instrument", "") for o in filled_orders)
 
         # Group by ticker
         ticker_groups = {}
         for order in filled_orders:
-            ticker = get_ticker_from_instrument(order.get("instrument", ""))
-            if ticker not in ticker_groups:
-                ticker_groups[ticker] = {"buys": [], "sells": []}
+            get = order.get
+            ticker = tickers.get(get("instrument", ""), "UNKNOWN")
+            group = ticker_groups.setdefault(ticker, {"buys": [], "sells": []})
 
             # Convert to structured format for matching algorithm
             try:
-                price = float(order.get('average_price', 0))
-                quantity = float(order.get('quantity', 0))
-
-                # Process executions to extract fees and timestamps
-                executions = order.get('executions', [])
-                fees = sum([float(e.get('fees', 0)) for e in executions])
-
-                trade_record = {
-                    'id': order.get('id'),
-                    'price': price,
-                    'quantity': quantity,
-                    'remaining_qty': quantity,  # For tracking matched portions
-                    'fees': fees,
-                    'timestamp': order.get('last_transaction_at'),
-                    'created_at': order.get('created_at')
-                }
+                # Process executions to extract fees
+                fees = math.fsum(float(e.get('fees', 0)) for e in get('executions', []))
+
+                trade_record = TradeRecord(
+                    id=get('id'),
+                    price=float(get('average_price', 0)),
+                    quantity=float(get('quantity', 0)),
+                    fees=fees,
+                    created_at=get('created_at')
+                )
 
                 # Add to appropriate category
-                if order.get('side') == 'buy':
-                    ticker_groups[ticker]["buys"].append(trade_record)
-                else:
-                    ticker_groups[ticker]["sells"].append(trade_record)
+                group["buys" if get('side') == 'buy' else "sells"].append(trade_record)
             except (ValueError, TypeError):
                 # Skip if conversion fails
                 continue
 
         # Process each ticker with the closest price matching algorithm
         results = []
-        total_profit = 0
+        ticker_profits = []
         total_matched_trades = 0
 
         for ticker, trades in ticker_groups.items():
@@ -598,86 +887,52 @@ async def analyze_trading_profit(date: str) -> Dict[str, Any]:
             sells = trades["sells"]
 
             # Sort buys by timestamp (earliest first)
-            buys.sort(key=lambda x: x['created_at'])
+            buys.sort(key=lambda x: x.created_at)
 
             # Sort sells by price (highest first to maximize profit)
-            sells.sort(key=lambda x: x['price'], reverse=True)
+            sells.sort(key=lambda x: x.price, reverse=True)
 
             # Match trades using closest price approach
-            matched_pairs = []
-
-            for buy in buys:
-                buy_qty = buy['remaining_qty']
-                buy_price = buy['price']
-
-                # Continue matching until this buy is fully matched or no more sells
-                while buy_qty > 0 and any(s['remaining_qty'] > 0 for s in sells):
-                    # Calculate price difference for each available sell
-                    price_diffs = []
-
-                    for i, sell in enumerate(sells):
-                        if sell['remaining_qty'] > 0:
-                            # Only consider sells that happened after this buy
-                            if sell['created_at'] > buy['created_at']:
-                                price_diff = abs(sell['price'] - buy_price)
-                                price_diffs.append((i, price_diff))
-
-                    if not price_diffs:
-                        break  # No eligible sells found
-
-                    # Sort by price difference (ascending)
-                    price_diffs.sort(key=lambda x: x[1])
-
-                    # Get the sell with closest price
-                    sell_idx = price_diffs[0][0]
-                    sell = sells[sell_idx]
-
-                    # Determine quantity to match
-                    match_qty = min(buy_qty, sell['remaining_qty'])
-
-                    if match_qty > 0:
-                        # Calculate profit for this match
-                        trade_profit = (sell['price'] - buy_price) * match_qty
-
-                        # Calculate proportional fees
-                        buy_fee_portion = buy['fees'] * (match_qty / buy['quantity'])
-                        sell_fee_portion = sell['fees'] * (match_qty / sell['quantity'])
-                        total_fees = buy_fee_portion + sell_fee_portion
-
-                        # Final profit after fees
-                        net_profit = trade_profit - total_fees
-
-                        matched_pairs.append({
-                            'buy_id': buy['id'],
-                            'sell_id': sell['id'],
-                            'quantity': match_qty,
-                            'buy_price': buy_price,
-                            'sell_price': sell['price'],
-                            'profit': round(net_profit, 2),
-                            'fees': round(total_fees, 2)
-                        })
-
-                        # Update remaining quantities
-                        buy['remaining_qty'] -= match_qty
-                        sells[sell_idx]['remaining_qty'] -= match_qty
-
-                        buy_qty -= match_qty
-
-            # Calculate ticker profits and stats
-            ticker_profit = sum(m['profit'] for m in matched_pairs)
-            total_profit += ticker_profit
+            matches = _match_trades(
+                [b.price for b in buys],
+                [b.quantity for b in buys],
+                [b.created_at for b in buys],
+                [b.fees for b in buys],
+                [s.price for s in sells],
+                [s.quantity for s in sells],
+                [s.created_at for s in sells],
+                [s.fees for s in sells]
+            )
+            matched_pairs = [
+                {
+                    'buy_id': buys[i].id,
+                    'sell_id': sells[j].id,
+                    'quantity': match_qty,
+                    'buy_price': buys[i].price,
+                    'sell_price': sells[j].price,
+                    'profit': round(net_profit, 2),
+                    'fees': round(match_fees, 2)
+                }
+                for i, j, match_qty, net_profit, match_fees in matches
+            ]
+
+            # Calculate ticker profits and stats (fsum keeps totals of many
+            # fractional amounts free of floating point drift)
+            ticker_profit = math.fsum(m['profit'] for m in matched_pairs)
+            ticker_fees = math.fsum(m['fees'] for m in matched_pairs)
+            ticker_profits.append(ticker_profit)
             total_matched_trades += len(matched_pairs)
 
             # Calculate total shares
-            buy_shares = sum(b['quantity'] for b in buys)
-            sell_shares = sum(s['quantity'] for s in sells)
-            matched_shares = sum(m['quantity'] for m in matched_pairs)
+            buy_shares = math.fsum(b.quantity for b in buys)
+            sell_shares = math.fsum(s.quantity for s in sells)
+            matched_shares = math.fsum(m['quantity'] for m in matched_pairs)
 
             avg_profit_per_share = 0
             if matched_shares > 0:
                 avg_profit_per_share = ticker_profit / matched_shares
 
-            results.append({
+            ticker_result = {
                 "ticker": ticker,
                 "buy_orders": len(buys),
                 "sell_orders": len(sells),
@@ -685,26 +940,29 @@ async def analyze_trading_profit(date: str) -> Dict[str, Any]:
                 "buy_shares": buy_shares,
                 "sell_shares": sell_shares,
                 "matched_shares": matched_shares,
-                "fees": round(sum(m['fees'] for m in matched_pairs), 2),
+                "fees": round(ticker_fees, 2),
                 "profit": round(ticker_profit, 2),
-                "avg_profit_per_share": round(avg_profit_per_share, 2),
-                "matches": matched_pairs
-            })
+                "avg_profit_per_share": round(avg_profit_per_share, 2)
+            }
+            if not summary:
+                ticker_result["matches"] = matched_pairs
+
+            results.append(ticker_result)
 
         # Sort results by profit (highest first)
         results.sort(key=lambda x: x['profit'], reverse=True)
 
-        return {
+        return _raw({
             "status": "success",
             "date": date,
-            "total_profit": round(total_profit, 2),
+            "total_profit": round(math.fsum(ticker_profits), 2),
             "ticker_results": results,
             "matched_trades": total_matched_trades,
             "trade_count": len(filled_orders),
             "algorithm": "closest_price_matching"
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to analyze trading profit: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to analyze trading profit: {str(e)}"})
 
 # ----- Prompts -----
 
@@ -771,7 +1029,7 @@ class TickerRequest(BaseModel):
     ticker: str = Field(..., description="Stock ticker symbol (e.g., 'AAPL')")
 
 @mcp.tool()
-async def get_limit_orders_by_ticker(request: TickerRequest) -> Dict[str, Any]:
+async def get_limit_orders_by_ticker(request: TickerRequest) -> TextContent:
     """
     Get all open limit orders (both buy and sell) for a specific ticker.
     
@@ -781,16 +1039,15 @@ async def get_limit_orders_by_ticker(request: TickerRequest) -> Dict[str, Any]:
     The results are sorted by order type (buys first, then sells) and then by price
     (highest to lowest for sells, lowest to highest for buys).
     """
+    ticker = request.ticker.upper()
     try:
-        ticker = request.ticker.upper()
-        all_open_orders = rh.orders.get_all_open_stock_orders()
+        all_open_orders = await asyncio.to_thread(_orders.get_all_open_stock_orders)
+        tickers = await resolve_tickers(order.get("instrument", "") for order in all_open_orders)
         
         # Filter orders for the specified ticker
         ticker_orders = []
         for order in all_open_orders:
-            # Get the ticker from the instrument URL
-            instrument_data = rh.stocks.get_instrument_by_url(order.get("instrument", ""))
-            order_ticker = instrument_data.get("symbol", "UNKNOWN")
+            order_ticker = tickers.get(order.get("instrument", ""), "UNKNOWN")
             
             if order_ticker == ticker:
                 # Format the order data
@@ -806,11 +1063,9 @@ async def get_limit_orders_by_ticker(request: TickerRequest) -> Dict[str, Any]:
                 }
                 
                 # Convert created_at time from UTC to Eastern Time
-                if "created_at" in order and order["created_at"]:
-                    # Parse the ISO timestamp
-                    utc_time = order["created_at"].replace('Z', '+00:00')
-                    # Calculate ET (UTC-4 during daylight saving time)
-                    formatted_order["created_at_et"] = f"{utc_time[0:19]}Z (ET: {utc_time[11:16]} ET)"
+                if order.get("created_at"):
+                    created_at = datetime.fromisoformat(order["created_at"].replace("Z", "+00:00"))
+                    formatted_order["created_at_et"] = created_at.astimezone(ET).isoformat(timespec="seconds")
                 
                 ticker_orders.append(formatted_order)
         
@@ -827,19 +1082,19 @@ async def get_limit_orders_by_ticker(request: TickerRequest) -> Dict[str, Any]:
         # Combine sorted orders with buys first, then sells
         sorted_orders = buy_orders + sell_orders
         
-        return {
+        return _raw({
             "status": "success",
             "ticker": ticker,
             "total_orders": len(sorted_orders),
             "buy_orders_count": len(buy_orders),
             "sell_orders_count": len(sell_orders),
             "orders": sorted_orders
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to get limit orders for {ticker}: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to get limit orders for {ticker}: {str(e)}"})
 
 @mcp.tool()
-async def get_all_limit_orders() -> Dict[str, Any]:
+async def get_all_limit_orders() -> TextContent:
     """
     Get all open limit orders across all tickers.
     
@@ -847,26 +1102,20 @@ async def get_all_limit_orders() -> Dict[str, Any]:
     including counts of buy vs sell orders and total order value for each ticker.
     """
     try:
-        all_open_orders = rh.orders.get_all_open_stock_orders()
+        all_open_orders = await asyncio.to_thread(_orders.get_all_open_stock_orders)
+        
+        # Skip non-limit orders
+        limit_orders = [order for order in all_open_orders if order.get("type") == "limit"]
+        tickers = await resolve_tickers(order.get("instrument", "") for order in limit_orders)
         
         # Group orders by ticker
         ticker_groups = {}
         
-        for order in all_open_orders:
-            # Skip non-limit orders
-            if order.get("type") != "limit":
-                continue
-                
-            # Get the ticker from the instrument URL
-            instrument_data = rh.stocks.get_instrument_by_url(order.get("instrument", ""))
-            ticker = instrument_data.get("symbol", "UNKNOWN")
+        for order in limit_orders:
+            ticker = tickers.get(order.get("instrument", ""), "UNKNOWN")
             
             # Initialize ticker group if needed
-            if ticker not in ticker_groups:
-                ticker_groups[ticker] = {
-                    "buy_orders": [],
-                    "sell_orders": [],
-                }
+            group = ticker_groups.setdefault(ticker, {"buy_orders": [], "sell_orders": []})
             
             # Extract relevant order data
             order_data = {
@@ -878,9 +1127,9 @@ async def get_all_limit_orders() -> Dict[str, Any]:
             
             # Add to appropriate list based on side
             if order.get("side") == "buy":
-                ticker_groups[ticker]["buy_orders"].append(order_data)
+                group["buy_orders"].append(order_data)
             else:
-                ticker_groups[ticker]["sell_orders"].append(order_data)
+                group["sell_orders"].append(order_data)
         
         # Format results for each ticker
         ticker_summaries = []
@@ -904,14 +1153,14 @@ async def get_all_limit_orders() -> Dict[str, Any]:
         # Sort by total orders (highest first)
         ticker_summaries.sort(key=lambda x: x["total_orders"], reverse=True)
         
-        return {
+        return _raw({
             "status": "success",
             "total_tickers": len(ticker_summaries),
             "total_limit_orders": sum(summary["total_orders"] for summary in ticker_summaries),
             "ticker_summaries": ticker_summaries
-        }
+        })
     except Exception as e:
-        return {"status": "error", "message": f"Failed to get limit orders: {str(e)}"}
+        return _raw({"status": "error", "message": f"Failed to get limit orders: {str(e)}"})
 
 # Run the server when executed directly
 if __name__ == "__main__":